@@ -1,10 +1,49 @@
 import os
+import time
+import uuid
+import hmac
+import random
+import asyncio
+import functools
+import platform
+import threading
+import hashlib
+import orjson
+import aiohttp
 import letterboxd
 import requests
+import numpy as np
 import pandas as pd
 import base62
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from yarl import URL
+from datetime import timedelta
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+API_BASE = 'https://api.letterboxd.com/api/v0'
+
+# Largest page size the API accepts for paginated endpoints; fewer pages means fewer round trips
+PER_PAGE = 100
+
+# Session for requests to the Letterboxd website itself (not the API), with (connect, read)
+# timeouts so a stalled lookup can't hang forever
+_lb_session = requests.Session()
+_LB_TIMEOUT = (3.05, 10)
+
+# Lookup tables between base62 digits and the ASCII codes of the inverted charset used by
+# Letterboxd IDs; 0xFF marks bytes that are not valid digits
+_ENCODE_TABLE = base62.CHARSET_INVERTED.encode()
+_DECODE_TABLE = bytes(_ENCODE_TABLE.find(code) & 0xFF for code in range(256))
+
+# Largest internal ID whose encoded value (internal_id*10 + 7) still fits in int64
+_MAX_VECTOR_ID = (np.iinfo(np.int64).max - 7) // 10
 
 def api_request(path: str):
     """
@@ -20,11 +59,222 @@ def api_request(path: str):
     requests.models.Response
         The response from the API.
     """
-    LBXD_KEY = os.environ['LBXD_KEY']
-    LBXD_SECRET = os.environ['LBXD_SECRET']
-    API_BASE = 'https://api.letterboxd.com/api/v0'
+    return _get_api().api_call(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _credentials():
+    """
+    Return the Letterboxd API key and secret from the LBXD_KEY and LBXD_SECRET environment
+    variables. They are read once, on first use rather than at import, so variables loaded
+    with python-dotenv after importing this module are still picked up.
+    """
+    return os.environ['LBXD_KEY'], os.environ['LBXD_SECRET']
+
+
+@functools.lru_cache(maxsize=1)
+def _get_api():
+    """
+    Return the shared letterboxd API client. It is built on first use, and its requests
+    session keeps connections to the API alive across api_request calls. The session's
+    connection pool is sized so that up to 50 threads calling api_request at once each
+    keep their connection instead of it being discarded after use.
+    
+    If the LBXD_CACHE environment variable is set to 1, successful GET responses are
+    cached for 6 hours in lbxd_cache.sqlite (requires requests-cache). The signing
+    parameters are left out of the cache key, since they change on every request.
+    """
+    LBXD_KEY, LBXD_SECRET = _credentials()
+    
+    api = letterboxd.api.API(api_base=API_BASE, api_key=LBXD_KEY, api_secret=LBXD_SECRET)
+    if os.environ.get('LBXD_CACHE') == '1':
+        try:
+            import requests_cache
+        except ImportError:
+            raise ImportError('LBXD_CACHE=1 requires requests-cache. Install it with pip install requests-cache')
+        api.session = requests_cache.CachedSession(
+            'lbxd_cache', backend='sqlite', expire_after=timedelta(hours=6), allowable_methods=('GET',),
+            ignored_parameters=('apikey', 'nonce', 'timestamp', 'signature'))
+        api.session.params = {}
+    api.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=50, max_retries=0))
+    return api
+
+
+def _signed_url(path: str, method: str = 'GET'):
+    """
+    Return the fully-qualified, signed URL for a Letterboxd API path. This replicates the
+    request signing done by the letterboxd library, which only works with its own
+    requests session, so that calls can also be sent through aiohttp.
+    
+    Parameters
+    ----------
+    path : str
+        The path to the API endpoint you want to call.
+    method : str, optional
+        The HTTP method the URL will be requested with. Defaults to 'GET'.
+    
+    Returns
+    -------
+    str
+        The URL including the apikey, nonce, timestamp and signature parameters.
+    """
+    LBXD_KEY, LBXD_SECRET = _credentials()
     
-    return letterboxd.api.API(api_base=API_BASE, api_key=LBXD_KEY, api_secret=LBXD_SECRET).api_call(path)
+    params = urlencode({'apikey': LBXD_KEY, 'nonce': uuid.uuid4(), 'timestamp': int(time.time())})
+    # Percent-encode the path the same way requests does before the letterboxd library signs it
+    url = requests.utils.requote_uri(f'{API_BASE}/{path}')
+    url = f"{url}{'&' if '?' in url else '?'}{params}"
+    salted = b'\x00'.join([method.encode(), url.encode(), b''])
+    signature = hmac.new(LBXD_SECRET.encode(), salted, digestmod=hashlib.sha256).hexdigest()
+    return f'{url}&signature={signature}'
+
+
+async def api_request_async(session, path: str):
+    """
+    Async counterpart of api_request. Sends a signed request for the given path through
+    a shared aiohttp session so connections are kept alive between calls. Unlike
+    api_request, error statuses are not raised; check response.status instead. The body
+    is returned alongside the response because aiohttp refuses to read() it again once
+    the connection has been released.
+    
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to send the request through.
+    path : str
+        The path to the API endpoint you want to call.
+    
+    Returns
+    -------
+    tuple
+        The aiohttp.ClientResponse from the API and its body as bytes.
+    """
+    # encoded=True stops yarl from re-quoting the URL, which would invalidate the signature
+    async with session.get(URL(_signed_url(path), encoded=True)) as response:
+        body = await response.read()
+    return response, body
+
+
+def _client_session(max_concurrent):
+    """
+    Return an aiohttp session whose connection pool holds at most max_concurrent
+    keep-alive connections to the API.
+    """
+    connector = aiohttp.TCPConnector(limit=max_concurrent, keepalive_timeout=60)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _new_event_loop():
+    """
+    Return a new event loop for running requests. On Linux this is a uvloop loop when
+    uvloop is installed, whose libuv-based I/O handles many concurrent sockets with less
+    per-request overhead than asyncio's default loop; otherwise the default loop is used.
+    """
+    if uvloop is not None and platform.system() == 'Linux':
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _run_on_new_loop(coro):
+    """
+    Run a coroutine to completion on a fresh event loop from _new_event_loop, then close it.
+    Like asyncio.run, tasks still pending at exit are cancelled and awaited before async
+    generators are shut down, so none are destroyed mid-request.
+    """
+    loop = _new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        pending = asyncio.all_tasks(loop)
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _run(coro):
+    """
+    Run a coroutine to completion and return its result. If an event loop is already
+    running in this thread (e.g. inside Jupyter), the coroutine is run on a fresh loop
+    in a worker thread instead, since event loops cannot be nested.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_new_loop(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(_run_on_new_loop, coro).result()
+
+
+def _iter_async(agen):
+    """
+    Iterate over an async generator from synchronous code. The generator runs on an event
+    loop in a background thread, so this also works when the calling thread already has a
+    running loop (e.g. inside Jupyter), and in-flight work keeps progressing while the
+    caller handles each item.
+    """
+    
+    async def next_item():
+        return await agen.__anext__()
+    
+    loop = _new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(next_item(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _paginate_async(session, path, description):
+    """
+    Yield the JSON pages of a cursor-paginated API endpoint. The request for the next page
+    is started as soon as its cursor is known, so it is in flight while the caller
+    processes the current page.
+    
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to send the requests through.
+    path : str
+        The path to the API endpoint, including its query string but without a cursor.
+    description : str
+        What is being pulled, e.g. 'watchlist for member ID abc', used in the ValueError
+        raised when a page request fails.
+    
+    Yields
+    ------
+    dict
+        The JSON body of each page, in order.
+    """
+    
+    async def fetch_page(cursor):
+        response, body = await api_request_async(session, f'{path}&cursor={cursor}')
+        if response.status != 200:
+            raise ValueError(f'Request failed when pulling {description}.\
+                               Status code: {response.status}')
+        return orjson.loads(body)
+    
+    next_page = asyncio.create_task(fetch_page('start=0'))
+    try:
+        while next_page is not None:
+            page = await next_page
+            cursor = page.get('next')
+            next_page = asyncio.create_task(fetch_page(cursor)) if cursor else None
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
 
 
 def get_id_from_username(member_name):
@@ -44,16 +294,20 @@ def get_id_from_username(member_name):
         The API member ID of the member whose username you passed in.
     """
     
-    head_request = requests.head(f'https://letterboxd.com/{member_name}/')
+    url = f'https://letterboxd.com/{member_name}/'
+    head_request = _lb_session.head(url, allow_redirects=False, timeout=_LB_TIMEOUT)
+    if head_request.is_redirect:
+        # Only follow redirects when the profile URL isn't canonical, picking up from the
+        # redirect already received
+        head_request = _lb_session.send(head_request.next, allow_redirects=True, timeout=_LB_TIMEOUT)
     status_code = head_request.status_code
     if status_code != 200:
         raise ValueError(f'Request failed when looking up member {member_name}.\
                            Status code: {status_code}')
-    res_headers = head_request.headers
+    member_id = head_request.headers.get('X-Letterboxd-Identifier')
 
-    if 'X-Letterboxd-Identifier' not in res_headers:
+    if member_id is None:
         raise KeyError(f'Page headers did not include Letterboxd Identifier. Possible change on their side?')
-    member_id = res_headers['X-Letterboxd-Identifier']
     return member_id
 
 
@@ -63,9 +317,7 @@ def get_member_watchlist(member_id):
     
     Parameters
     ----------
-    member_name : str, optional
-        The username of the member whose watchlist you want to pull.
-    member_id : str, optional
+    member_id : str
         The member ID of the member whose watchlist you want to pull.
         
     Returns
@@ -75,31 +327,66 @@ def get_member_watchlist(member_id):
     """
         
     full_results = []
+    cursor = 'start=0'
     
-    def paginate_watchlist(cursor='start=0'):    
-        wl_response = api_request(f'member/{member_id}/watchlist?perPage=100&cursor={cursor}')
+    while cursor is not None:
+        wl_response = api_request(f'member/{member_id}/watchlist?perPage={PER_PAGE}&cursor={cursor}')
         wl_response_status = wl_response.status_code
         if wl_response_status != 200:
             raise ValueError(f'Request failed when pulling watchlist for member ID {member_id}.\
                                Status code: {wl_response_status}')
-        wl_json = wl_response.json()
-        full_results.extend(wl_json['items'])
-        if 'next' in wl_json.keys():
-            paginate_watchlist(cursor=wl_json['next'])
-    
-    paginate_watchlist(full_results)
+        wl_json = orjson.loads(wl_response.content)
+        full_results.extend(wl_json.get('items', ()))
+        cursor = wl_json.get('next')
     
     return pd.DataFrame(full_results)
 
 
-def get_combined_watchlists(member_ids):
+async def get_member_watchlist_async(session, member_id):
     """
-    Return the combined watchlists of a list of members.
+    Async counterpart of get_member_watchlist. Pages are prefetched, so the next page is
+    being downloaded while the current one is processed.
+    
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to send the requests through.
+    member_id : str
+        The member ID of the member whose watchlist you want to pull.
+        
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the member's watchlist.
+    """
+    
+    return pd.DataFrame(await _get_member_watchlist_items_async(session, member_id))
+
+
+async def _get_member_watchlist_items_async(session, member_id):
+    """
+    Return the raw watchlist items of a member as a list of API film summaries.
+    """
+    full_results = []
+    
+    async for page in _paginate_async(session, f'member/{member_id}/watchlist?perPage={PER_PAGE}',
+                                     f'watchlist for member ID {member_id}'):
+        full_results.extend(page.get('items', ()))
+    
+    return full_results
+
+
+def get_combined_watchlists(member_ids, max_concurrent=10):
+    """
+    Return the combined watchlists of a list of members. The watchlists are pulled
+    concurrently over a shared connection pool.
     
     Parameters
     ----------
     member_ids : list
         A list of member IDs whose watchlists you want to combine.
+    max_concurrent : int, optional
+        The maximum number of watchlists to pull at the same time. Defaults to 10.
         
     Returns
     -------
@@ -107,18 +394,34 @@ def get_combined_watchlists(member_ids):
         A DataFrame containing the combined watchlists of the members you passed in.
     """
     
-    watchlists = []
+    async def fetch_watchlist(session, semaphore, member_id):
+        async with semaphore:
+            return await _get_member_watchlist_items_async(session, member_id)
     
-    for member_id in member_ids:
-        watchlist = get_member_watchlist(member_id)
-        watchlists.append(watchlist)
+    async def runner():
+        semaphore = asyncio.Semaphore(max_concurrent)
+        async with _client_session(max_concurrent) as session:
+            tasks = [asyncio.create_task(fetch_watchlist(session, semaphore, member_id))
+                     for member_id in member_ids]
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the other members' requests as soon as one of them fails
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
     
-    combined_watchlist = pd.concat(watchlists)
+    watchlists = _run(runner())
+    
+    # Flatten the raw items and build one frame, rather than concatenating (and copying)
+    # one DataFrame per member
+    combined_watchlist = pd.DataFrame([item for watchlist in watchlists for item in watchlist])
     
     return combined_watchlist
 
 
-def get_member_watches(member_id):
+def get_member_watches(member_id, rated_only=False):
     """
     Return a member's watched films and their ratings, if any, from the Letterboxd API.
     
@@ -126,6 +429,9 @@ def get_member_watches(member_id):
     ----------
     member_id : str
         The member ID of the member whose watches you want to pull.
+    rated_only : bool, optional
+        Whether to return only the films the member rated. Since watches are sorted by
+        rating, this stops paginating at the first unrated film. Defaults to False.
         
     Returns
     -------
@@ -134,90 +440,231 @@ def get_member_watches(member_id):
     """
     
     cursor = 'start=0'
-    results = {'next':None}
-    all_ratings = []
+    films = []
+    ratings = []
 
-    while True:
+    while cursor is not None:
         response = api_request(
-            f'films/?perPage=100&member={member_id}&memberRelationship=Watched&sort=MemberRatingHighToLow&cursor={cursor}')
-        results = response.json()
-        for item in results['items']:
-            entry = {'member': member_id}
-            entry['film'] = item.get('id')
-            relationships = item.get('relationships')
-            if relationships:
-                relationship = relationships[0].get('relationship')
-                if relationship:
-                    entry['rating'] = relationship.get('rating')
-            all_ratings.append(entry)
-        if 'next' not in results:
+            f'films/?perPage={PER_PAGE}&member={member_id}&memberRelationship=Watched&sort=MemberRatingHighToLow&cursor={cursor}')
+        results = orjson.loads(response.content)
+        if _extend_watches(films, ratings, results.get('items', ()), rated_only):
             break
-        else:
-            cursor = results['next']
+        cursor = results.get('next')
         
-    return pd.DataFrame(all_ratings)
+    return _watches_frame(member_id, films, ratings)
 
 
-def threaded_api_request(url_list, max_retries=15, max_threads=50, print_every=1000):
+async def get_member_watches_async(session, member_id, rated_only=False):
     """
-    Return the results of a list of API requests. This function is multithreaded and will
-    retry failed requests up to max_retries times. It will also print a status update every
+    Async counterpart of get_member_watches. Pages are prefetched, so the next page is
+    being downloaded while the current one is parsed.
+    
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        The session to send the requests through.
+    member_id : str
+        The member ID of the member whose watches you want to pull.
+    rated_only : bool, optional
+        Whether to return only the films the member rated, stopping at the first
+        unrated film. Defaults to False.
+        
+    Returns
+    -------
+    pd.DataFrame
+        A DataFrame containing the member's watched films and their ratings, if any.
+    """
+    
+    films = []
+    ratings = []
+    path = f'films/?perPage={PER_PAGE}&member={member_id}&memberRelationship=Watched&sort=MemberRatingHighToLow'
+    
+    pages = _paginate_async(session, path, f'watches for member ID {member_id}')
+    try:
+        async for page in pages:
+            if _extend_watches(films, ratings, page.get('items', ()), rated_only):
+                break
+    finally:
+        # Cancels the prefetch of a page that is no longer needed
+        await pages.aclose()
+    
+    return _watches_frame(member_id, films, ratings)
+
+
+def _extend_watches(films, ratings, items, rated_only=False):
+    """
+    Append the film ID and rating, if any, of each films API item to the films and
+    ratings column lists. With rated_only, stops at the first unrated film and returns
+    True, as watches sorted by rating list every rated film before the unrated ones.
+    """
+    append_film = films.append
+    append_rating = ratings.append
+    for item in items:
+        relationships = item.get('relationships')
+        relationship = relationships[0].get('relationship') if relationships else None
+        rating = relationship.get('rating') if relationship else None
+        if rated_only and rating is None:
+            return True
+        append_film(item.get('id'))
+        append_rating(rating)
+    return False
+
+
+def _watches_frame(member_id, films, ratings):
+    """
+    Return the watches DataFrame of a member, built column by column from the film ID and
+    rating lists. Ratings are always float, with NaN for unrated films.
+    """
+    # dtype=float so a member with no ratings gets NaN, not an object column of None
+    return pd.DataFrame({'member': [member_id] * len(films), 'film': films,
+                         'rating': np.array(ratings, dtype=float)})
+
+
+def iter_api_results(url_list, max_retries=15, max_threads=50, print_every=1000,
+                     missing_urls=None, failed_urls=None):
+    """
+    Yield the results of a list of API requests as they complete. The requests are run
+    concurrently by max_threads worker coroutines sharing one keep-alive connection pool,
+    and workers wait for the caller to take results before starting more requests, so only
+    about max_threads responses are held in memory at once. Server errors, rate limiting
+    (429) and connection errors are retried with exponential backoff up to max_retries
+    times; other client errors are not retried. It will also print a status update every
     print_every requests.
     
     Parameters
     ----------
-    url_list : list
-        A list of API endpoints you want to call.
+    url_list : iterable
+        The API endpoints you want to call.
     max_retries : int, optional
         The number of times to retry a failed request. Defaults to 15.
     max_threads : int, optional
-        The maximum number of threads to use. Defaults to 50.
-    
-    Returns
-    -------
-    list
-        A list of the results of the API requests you passed in.
+        The maximum number of concurrent requests. Defaults to 50.
+    print_every : int, optional
+        How many processed requests to print a status update after. Defaults to 1000.
+    missing_urls : list, optional
+        If given, endpoints that returned 404 are appended to it.
+    failed_urls : list, optional
+        If given, endpoints that failed for any other reason are appended to it.
     
+    Yields
+    ------
+    dict
+        The JSON result of each successful API request, in completion order.
     """
+    
+    if missing_urls is None:
+        missing_urls = []
+    if failed_urls is None:
+        failed_urls = []
 
-    all_results = []
-    missing_urls = []
-    failed_urls = []
-
-    def error_handler(url):
+    async def error_handler(session, url):
 
         retry_count = 0
 
         while True:
             try:
-                res = api_request(url)
-                return res.json()
-            except Exception as e:
-                if str(e)[0:3] == '404':
+                res, body = await api_request_async(session, url)
+                if res.status == 404:
                     missing_urls.append(url)
                     return None
-                retry_count += 1
-                if retry_count > max_retries:
+                if 400 <= res.status < 500 and res.status != 429:
+                    # Other client errors will fail the same way on every retry
                     failed_urls.append(url)
-                    print('Url failed after 15 retries.')
                     return None
+                if res.ok:
+                    return orjson.loads(body)
+            except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+                pass
+            retry_count += 1
+            if retry_count > max_retries:
+                failed_urls.append(url)
+                print(f'Url failed after {max_retries} retries.')
+                return None
+            # Exponential backoff with jitter so retries don't hammer the rate limiter in sync
+            await asyncio.sleep(min(0.5 * 2 ** retry_count, 30) + random.random())
 
-    def runner(url_list):
+    finished = object()
+
+    async def worker(session, urls, results):
+        # Workers share one iterator, so each URL is taken by exactly one of them
+        try:
+            for url in urls:
+                await results.put(await error_handler(session, url))
+            await results.put(finished)
+        except Exception as error:
+            await results.put(error)
+
+    async def runner():
         count = 0
-        threads = [] 
-        with ThreadPoolExecutor(max_workers=max_threads) as executor:
-            for url in url_list:
-                threads.append(executor.submit(error_handler, url))
-            for task in as_completed(threads):
-                entry = task.result()
-                if entry:
-                    all_results.append(entry)
-                count += 1
-                if count % print_every == 0:
-                    print(f'{count} URLs processed so far.')
+        urls = iter(url_list)
+        results = asyncio.Queue(maxsize=max_threads)
+        async with _client_session(max_threads) as session:
+            workers = [asyncio.create_task(worker(session, urls, results)) for _ in range(max_threads)]
+            running = len(workers)
+            try:
+                while running:
+                    # Hand over everything that is ready at once, since each handover
+                    # crosses to the caller's thread
+                    entries = [await results.get()]
+                    while not results.empty():
+                        entries.append(results.get_nowait())
+                    batch = []
+                    for entry in entries:
+                        if entry is finished:
+                            running -= 1
+                            continue
+                        if isinstance(entry, Exception):
+                            raise entry
+                        count += 1
+                        if count % print_every == 0:
+                            print(f'{count} URLs processed so far.')
+                        if entry:
+                            batch.append(entry)
+                    if batch:
+                        yield batch
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    batches = _iter_async(runner())
+    try:
+        for batch in batches:
+            yield from batch
+    finally:
+        # Stop the workers and the loop thread as soon as this generator is closed, rather
+        # than whenever the inner generator happens to be garbage collected
+        batches.close()
+
+
+def threaded_api_request(url_list, max_retries=15, max_threads=50, print_every=1000):
+    """
+    Return the results of a list of API requests. This collects every result of
+    iter_api_results into a list; use that directly to process results as they arrive
+    without holding all of them in memory.
+    
+    Parameters
+    ----------
+    url_list : list
+        A list of API endpoints you want to call.
+    max_retries : int, optional
+        The number of times to retry a failed request. Defaults to 15.
+    max_threads : int, optional
+        The maximum number of concurrent requests. Defaults to 50.
+    
+    Returns
+    -------
+    list
+        A list of the results of the API requests you passed in.
+    
+    """
+
+    missing_urls = []
+    failed_urls = []
 
     print('Running scraper...')
-    runner(url_list)
+    all_results = list(iter_api_results(url_list, max_retries, max_threads, print_every,
+                                        missing_urls, failed_urls))
     
     return all_results, missing_urls, failed_urls
 
@@ -238,7 +685,7 @@ def get_member_info(member_id):
     """
     
     member_info = api_request(f'member/{member_id}')
-    return member_info.json()
+    return orjson.loads(member_info.content)
 
 
 def encode_id(internal_id, is_user=False):
@@ -250,16 +697,21 @@ def encode_id(internal_id, is_user=False):
     ----------
     internal_id : int
         The internal ID you want to encode.
+    is_user : bool, optional
+        Whether the ID belongs to a member rather than a film. Defaults to False.
     
     Returns
     -------
     str
         The base62-encoded version of the internal ID you passed in.
     """
-    if is_user:
-        return base62.encode((internal_id*10) + 7, charset=base62.CHARSET_INVERTED)
-    else:
-        return base62.encode(internal_id*10, charset=base62.CHARSET_INVERTED)
+    n = (internal_id*10) + 7 if is_user else internal_id*10
+    digits = bytearray()
+    while n > 0:
+        n, r = divmod(n, 62)
+        digits.append(_ENCODE_TABLE[r])
+    digits.reverse()
+    return digits.decode() or '0'
 
 
 def decode_id(external_id):
@@ -277,5 +729,105 @@ def decode_id(external_id):
     int
         The base62-decoded version of the external ID you passed in.
     """
+    value = 0
+    for code in external_id.encode():
+        digit = _DECODE_TABLE[code]
+        if digit == 0xFF:
+            raise ValueError(f'Invalid character in external ID {external_id}')
+        value = value*62 + digit
+    return value // 10
+
+
+def _id_array(ids, single_id_function):
+    """
+    Return ids as a one-dimensional NumPy array, raising if it is a single ID or contains
+    missing values, which would otherwise be converted to wrong IDs without an error.
+    """
+    if np.ndim(ids) != 1:
+        raise TypeError(f'Expected a one-dimensional array of IDs; use {single_id_function} for a single ID')
+    # Checked before np.asarray, which would turn None and NaN into the strings 'None' and 'nan'
+    if pd.isna(ids).any():
+        raise ValueError('IDs contain missing values; drop or fill them before converting')
+    return np.asarray(ids)
+
+
+def encode_ids(internal_ids, is_user=False):
+    """
+    Vectorized version of encode_id. Returns the base62-encoded versions of an array of
+    Letterboxd internal IDs, computing one digit position for every ID at a time.
+    
+    Parameters
+    ----------
+    internal_ids : array-like
+        The internal IDs you want to encode.
+    is_user : bool, optional
+        Whether the IDs belong to members rather than films. Defaults to False.
+    
+    Returns
+    -------
+    np.ndarray
+        An array of the base62-encoded versions of the internal IDs you passed in.
+    """
+    ids = _id_array(internal_ids, 'encode_id')
+    if len(ids) and ids.max() > _MAX_VECTOR_ID:
+        raise ValueError(f'Internal IDs above {_MAX_VECTOR_ID} do not fit in int64; use encode_id instead')
+    values = np.maximum(ids.astype(np.int64)*10 + (7 if is_user else 0), 0)
+    
+    n_digits = np.ones(len(values), dtype=np.int64)
+    rest = values // 62
+    while rest.any():
+        n_digits += rest > 0
+        rest //= 62
+    
+    # Write the digits left-aligned, least significant last; the zero padding after
+    # shorter IDs is dropped by the bytes dtype
+    width = int(n_digits.max(initial=1))
+    buffer = np.zeros((len(values), width), dtype=np.uint8)
+    rows = np.arange(len(values))
+    encode_table = np.frombuffer(_ENCODE_TABLE, dtype=np.uint8)
+    for position in range(width):
+        in_id = position < n_digits
+        buffer[rows[in_id], n_digits[in_id] - 1 - position] = encode_table[values[in_id] % 62]
+        values //= 62
+    
+    return buffer.view(f'S{width}').ravel().astype(str)
+
+
+def decode_ids(external_ids):
+    """
+    Vectorized version of decode_id. Returns the base62-decoded internal IDs of an array of
+    Letterboxd external IDs, evaluating one character position for every ID at a time.
+    
+    Parameters
+    ----------
+    external_ids : array-like
+        The external IDs you want to decode, e.g. a column of film IDs.
+    
+    Returns
+    -------
+    np.ndarray
+        An int64 array of the base62-decoded versions of the external IDs you passed in.
+    """
+    ids = _id_array(external_ids, 'decode_id')
+    if not len(ids):
+        return np.zeros(0, dtype=np.int64)
+    try:
+        codes = ids.astype(bytes)
+    except UnicodeEncodeError:
+        raise ValueError('Invalid character in external IDs')
+    width = codes.dtype.itemsize
+    if width > 10:
+        raise ValueError('External IDs longer than 10 characters do not fit in int64')
+    
+    lengths = np.char.str_len(codes)
+    matrix = codes.view(np.uint8).reshape(len(codes), width)
+    digits = np.frombuffer(_DECODE_TABLE, dtype=np.uint8)[matrix]
+    in_id = np.arange(width) < lengths[:, None]
+    if (in_id & (digits == 0xFF)).any():
+        raise ValueError('Invalid character in external IDs')
+    
+    values = np.zeros(len(codes), dtype=np.int64)
+    for position in range(width):
+        values = np.where(in_id[:, position], values*62 + digits[:, position], values)
     
-    return int(base62.decode(external_id, charset=base62.CHARSET_INVERTED)/10)
\ No newline at end of file
+    return values // 10
@@ -7,5 +7,6 @@ setup(
    description='Wrapper around the letterboxd library which is itself a wrapper around the Letterboxd API ',
    author='Daniel Quandt',
    author_email='danieltquandt@gmail.com',
-   install_requires=['pandas', 'pybase62', 'letterboxd', 'python-dotenv'], #external packages as dependencies
+   install_requires=['pandas', 'numpy', 'pybase62', 'letterboxd', 'python-dotenv', 'aiohttp', 'orjson'], #external packages as dependencies
+   extras_require={'cache': ['requests-cache'], 'uvloop': ['uvloop; platform_system == "Linux"']},
 )
\ No newline at end of file
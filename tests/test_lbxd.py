@@ -0,0 +1,156 @@
+import gc
+import uuid
+import asyncio
+import threading
+
+from types import SimpleNamespace
+
+import pytest
+import letterboxd
+import requests
+import orjson
+import numpy as np
+import pandas as pd
+
+import lbxd
+
+
+NONCE = uuid.UUID('12345678-1234-5678-1234-567812345678')
+TIMESTAMP = 1700000000.0
+
+
+@pytest.fixture
+def fixed_signing(monkeypatch):
+    monkeypatch.setenv('LBXD_KEY', 'key')
+    monkeypatch.setenv('LBXD_SECRET', 'secret')
+    monkeypatch.setattr(uuid, 'uuid4', lambda: NONCE)
+    monkeypatch.setattr('time.time', lambda: TIMESTAMP)
+    lbxd._credentials.cache_clear()
+    yield
+    lbxd._credentials.cache_clear()
+
+
+def letterboxd_url(path):
+    """
+    Return the signed URL the letterboxd library sends for a GET of path.
+    """
+    api = letterboxd.api.API(api_base=lbxd.API_BASE, api_key='key', api_secret='secret')
+    sent = []
+
+    def send(prepared_request, **kwargs):
+        sent.append(prepared_request.url)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    api.session.send = send
+    api.api_call(path, params={})
+    return sent[0]
+
+
+@pytest.mark.parametrize('path', [
+    'member/abc',
+    'films/?perPage=100&member=abc&cursor=start=0',
+    'search?input=the thing',
+    'search?input=amélie',
+])
+def test_signed_url_matches_letterboxd(fixed_signing, path):
+    assert lbxd._signed_url(path) == letterboxd_url(path)
+
+
+def test_vectorized_ids_match_scalar_functions():
+    internal_ids = [0, 1, 61, 62, 12345, 10**9, 62**10 // 10 - 1]
+    for is_user in (False, True):
+        external_ids = lbxd.encode_ids(internal_ids, is_user)
+        assert list(external_ids) == [lbxd.encode_id(i, is_user) for i in internal_ids]
+        assert list(lbxd.decode_ids(external_ids)) == [lbxd.decode_id(e) for e in external_ids]
+
+
+@pytest.mark.parametrize('external_ids', [
+    pd.Series(['2bbs', None]),
+    ['2bbs', np.nan],
+    pd.Series(['2bbs', pd.NA], dtype='string'),
+])
+def test_decode_ids_rejects_missing_values(external_ids):
+    with pytest.raises(ValueError):
+        lbxd.decode_ids(external_ids)
+
+
+def test_decode_ids_rejects_non_ascii_like_decode_id():
+    with pytest.raises(ValueError):
+        lbxd.decode_id('amé')
+    with pytest.raises(ValueError):
+        lbxd.decode_ids(['amé'])
+
+
+def test_vectorized_ids_reject_single_ids():
+    with pytest.raises(TypeError):
+        lbxd.decode_ids('2bbs')
+    with pytest.raises(TypeError):
+        lbxd.encode_ids(5)
+
+
+def test_encode_ids_rejects_ids_that_overflow_int64():
+    with pytest.raises(ValueError):
+        lbxd.encode_ids([10**18])
+
+
+def test_combined_watchlists_failure_names_member(monkeypatch, capfd, caplog):
+    in_flight = set()
+
+    async def request(session, path):
+        # Every member but 'bad' keeps paging slowly, so it is still fetching when 'bad' fails
+        in_flight.add(path)
+        try:
+            if path.startswith('member/bad/'):
+                await asyncio.sleep(0.01)
+                return SimpleNamespace(status=404), b''
+            await asyncio.sleep(0.05)
+            return SimpleNamespace(status=200), orjson.dumps({'items': [{'id': 'f'}], 'next': 'start=1'})
+        finally:
+            in_flight.discard(path)
+
+    left_pending = []
+
+    def run(coro):
+        # Record what get_combined_watchlists itself left running, before _run cleans up
+        async def main():
+            try:
+                return await coro
+            finally:
+                left_pending.extend(task for task in asyncio.all_tasks()
+                                    if task is not asyncio.current_task())
+        return lbxd._run_on_new_loop(main())
+
+    monkeypatch.setattr(lbxd, 'api_request_async', request)
+    monkeypatch.setattr(lbxd, '_run', run)
+    with pytest.raises(ValueError, match='watchlist for member ID bad'):
+        lbxd.get_combined_watchlists(['a', 'bad', 'c', 'd'])
+    gc.collect()
+    assert not left_pending
+    assert not in_flight
+    assert not caplog.records
+    assert capfd.readouterr().err == ''
+
+
+def test_closing_iter_api_results_stops_loop_thread(monkeypatch):
+    async def ok_request(session, path):
+        return SimpleNamespace(status=200, ok=True), orjson.dumps({'path': path})
+
+    monkeypatch.setattr(lbxd, 'api_request_async', ok_request)
+    threads_before = threading.active_count()
+    results = lbxd.iter_api_results([f'member/{i}' for i in range(500)], max_threads=5)
+    assert 'path' in next(results)
+    assert threading.active_count() == threads_before + 1
+    results.close()
+    assert threading.active_count() == threads_before
+
+
+def test_watches_ratings_are_float_when_nothing_is_rated():
+    films = []
+    ratings = []
+    lbxd._extend_watches(films, ratings, [{'id': 'a'}, {'id': 'b', 'relationships': []}])
+    watches = lbxd._watches_frame('m', films, ratings)
+    assert watches['rating'].dtype == float
+    assert watches['rating'].isna().all()
+    assert lbxd._watches_frame('m', [], [])['rating'].dtype == float